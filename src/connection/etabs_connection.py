@@ -1,14 +1,35 @@
 import sys
+from functools import lru_cache
+
 import comtypes.client
 
 
 default_path = r"C:\Program Files\Computers and Structures\ETABS 22\ETABS.exe"
 
 
-def connect_to_etabs(attach_to_instance=True, specify_path=False, program_path=default_path):
+@lru_cache(maxsize=None)
+def _get_helper():
+    """
+    Create the ETABS helper once per process and cache its cHelper interface.
 
+    CreateObject generates the (large) comtypes.gen.ETABSv1 wrapper on first use,
+    so the module is imported lazily here instead of at import time.
+    """
     helper = comtypes.client.CreateObject("ETABSv1.Helper")
-    helper = helper.QueryInterface(comtypes.gen.ETABSv1.cHelper)
+    from comtypes.gen import ETABSv1
+    return helper.QueryInterface(ETABSv1.cHelper)
+
+
+def connect_to_etabs(attach_to_instance=True, specify_path=False, program_path=default_path):
+    """
+    Attach to (or start) ETABS and return its SapModel object.
+
+    The returned object belongs to the calling thread's COM apartment. ETABS
+    serves OAPI calls one at a time, so element creation is kept serial;
+    calling SapModel from worker threads would need per-thread CoInitialize
+    and interface marshalling, and the calls would still be serialized.
+    """
+    helper = _get_helper()
 
     if attach_to_instance:
         try:
@@ -1,5 +1,7 @@
 # Example CLI usage
 # -----------------------
+import logging
+
 from connection.etabs_connection import connect_to_etabs
 from materials.concrete_material import define_concrete_materials
 from modeling.model_slabs import create_slabs_in_etabs
@@ -13,10 +15,10 @@ from sections.wall_shell import define_wall_sections
 from utils.buid_etabs_level_by_level import etabs_model_builder_level_by_level
 from utils.build_etabs_data import etabs_model_builder
 from utils.dxf_processing import get_points_by_layer, read_dxf_plan, get_lines_by_layer
-from utils.excel_processing import read_story_table, read_concrete_table, read_rectangular_column_table, \
-    read_circular_column_table, read_wall_table, read_slab_table, read_coupling_beam_table
+from utils.excel_processing import read_all_tables
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     # etabs_model_builder()
     etabs_model_builder_level_by_level()
 
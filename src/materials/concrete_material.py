@@ -1,7 +1,12 @@
+import logging
+
 from models.element_infor import Concrete
+from utils.name_cache import NameCache
+
+logger = logging.getLogger(__name__)
 
 
-def define_concrete_materials(sap_model, materials: list[Concrete]):
+def define_concrete_materials(sap_model, materials: list[Concrete], name_cache: NameCache | None = None):
     """
     Defines one or more concrete materials in a SAP2000 model.
 
@@ -12,26 +17,35 @@ def define_concrete_materials(sap_model, materials: list[Concrete]):
     Args:
         sap_model: The active SAP2000 model object from the OAPI.
         materials: A list of `Concrete` dataclass objects to be defined.
+        name_cache: Property name cache shared by the current build (optional).
     """
     MATERIAL_CONCRETE = 2  # SAP2000 API code for concrete material type
 
     try:
-        # Get all existing material names once to avoid repeated API calls
-        existing_mats = sap_model.PropMaterial.GetNameList()[1]
+        # Existing material names, fetched from ETABS at most once per build
+        if name_cache is None:
+            name_cache = NameCache(sap_model)
+        existing_mats = name_cache.material_names()
+        prop_material = sap_model.PropMaterial
+        set_material = prop_material.SetMaterial
+        set_mp_isotropic = prop_material.SetMPIsotropic
+        set_o_concrete = prop_material.SetOConcrete_1
 
         for mat in materials:
             # --- Skip if material with the same name already exists ---
             if mat.name in existing_mats:
-                print(f"Info: Material '{mat.name}' already exists. Skipping definition.")
+                logger.info("Material '%s' already exists. Skipping definition.", mat.name)
                 continue
 
-            print(f"Defining material: '{mat.name}'...")
+            logger.info("Defining material: '%s'...", mat.name)
 
             # --- 1. Set the base material type to Concrete ---
-            sap_model.PropMaterial.SetMaterial(mat.name, MATERIAL_CONCRETE)
+            ret = set_material(mat.name, MATERIAL_CONCRETE)
+            if ret == 0:
+                existing_mats.add(mat.name)
 
             # --- 2. Define basic isotropic mechanical properties ---
-            sap_model.PropMaterial.SetMPIsotropic(
+            set_mp_isotropic(
                 mat.name,
                 mat.Ec,
                 mat.nu,
@@ -41,7 +55,7 @@ def define_concrete_materials(sap_model, materials: list[Concrete]):
             # --- 3. Define nonlinear stress-strain properties (Mander model) ---
             # Note: StressStrainCurveType = 2 corresponds to the Mander model.
             # The 'fcs_factor' is ignored when using this model.
-            sap_model.PropMaterial.SetOConcrete_1(
+            set_o_concrete(
                 mat.name,
                 mat.fc,
                 mat.is_lightweight,
@@ -55,4 +69,4 @@ def define_concrete_materials(sap_model, materials: list[Concrete]):
             )
 
     except Exception as e:
-        print(f"Error: An exception occurred while defining concrete materials. Details: {e}")
\ No newline at end of file
+        logger.error("An exception occurred while defining concrete materials. Details: %s", e)
\ No newline at end of file
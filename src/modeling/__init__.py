@@ -0,0 +1 @@
+GLOBAL_CS = "Global"  # Coordinate system name passed to every OAPI call
@@ -1,41 +1,56 @@
+import logging
 from typing import List
 
+from modeling import GLOBAL_CS
 from models.geometry3d import BeamGeom
 
+logger = logging.getLogger(__name__)
+
 
 def create_beams_in_etabs(sap_model, beam_geometries: List[BeamGeom]):
     """
     Create coupling beam elements in ETABS using the AddByCoord method.
 
+    The OAPI has no list form of FrameObj.AddByCoord, so the per-call arguments
+    are flattened up front.
+
     Args:
-        sap_model: ETABS model object
+        sap_model: ETABS model object, already unlocked by the caller
         beam_geometries: List of BeamGeom objects
     """
     created_count = 0
+    failures: list[tuple] = []  # (user name or first point, error code)
 
-    for beam_geom in beam_geometries:
-        try:
-            # Extract coordinates
-            xi, yi, zi = beam_geom.start_point
-            xj, yj, zj = beam_geom.end_point
+    # Flatten geometry into call arguments: I-End, J-End, section, user name
+    frame_args = [
+        (*beam_geom.start_point, *beam_geom.end_point, beam_geom.prop_name, beam_geom.name)
+        for beam_geom in beam_geometries
+    ]
+    add_frame = sap_model.FrameObj.AddByCoord
 
+    try:
+        for xi, yi, zi, xj, yj, zj, prop_name, user_name in frame_args:
             # Create beam using ETABS API
             name = ""  # Will be assigned by ETABS
-            ret = sap_model.FrameObj.AddByCoord(
+            ret = add_frame(
                 xi, yi, zi,  # I-End coordinates
                 xj, yj, zj,  # J-End coordinates
                 name,  # Name (will be assigned by ETABS)
-                beam_geom.prop_name,  # Section property name
-                beam_geom.name,  # User name
-                "Global"  # Coordinate system
+                prop_name,  # Section property name
+                user_name,  # User name
+                GLOBAL_CS  # Coordinate system
             )
 
             if ret[1] != 0:  # ret[1] is the error code
-                print(f"⚠️ Warning: Failed to create coupling beam {beam_geom.name}. Error code: {ret[1]}")
+                failures.append((user_name or (xi, yi, zi), ret[1]))
             else:
                 created_count += 1
-
-        except Exception as e:
-            print(f"❌ Error creating coupling beam {beam_geom.name}: {e}")
-
-    print(f"✅ Successfully created {created_count} coupling beams in ETABS.")
\ No newline at end of file
+    except Exception as e:
+        # COM return codes are handled above; anything raised here aborts the batch
+        logger.error("❌ Error creating coupling beams (stopped after %d of %d): %s",
+                     created_count + len(failures), len(frame_args), e)
+
+    if failures:
+        logger.warning("⚠️ Failed to create %d/%d coupling beams (name or first point, error code): %s",
+                       len(failures), len(frame_args), failures[:10])
+    logger.info("✅ Successfully created %d coupling beams in ETABS.", created_count)
@@ -1,41 +1,52 @@
+import logging
 from typing import List
 
+from modeling import GLOBAL_CS
 from models.geometry3d import ColumnGeom
 
+logger = logging.getLogger(__name__)
+
 
 def create_columns_in_etabs(sap_model, column_geometries: List[ColumnGeom]):
     """
     Create column elements in ETABS using the AddByCoord method.
 
     Args:
-        sap_model: ETABS model object
+        sap_model: ETABS model object, already unlocked by the caller
         column_geometries: List of ColumnGeom objects
     """
     created_count = 0
+    failures: list[tuple] = []  # (user name or first point, error code)
 
-    for col_geom in column_geometries:
-        try:
-            # Extract coordinates
-            xi, yi, zi = col_geom.start_point
-            xj, yj, zj = col_geom.end_point
+    # Flatten geometry into call arguments: I-End, J-End, section, user name
+    frame_args = [
+        (*col_geom.start_point, *col_geom.end_point, col_geom.prop_name, col_geom.name)
+        for col_geom in column_geometries
+    ]
+    add_frame = sap_model.FrameObj.AddByCoord
 
+    try:
+        for xi, yi, zi, xj, yj, zj, prop_name, user_name in frame_args:
             # Create column using ETABS API
             name = ""  # Will be assigned by ETABS
-            ret = sap_model.FrameObj.AddByCoord(
+            ret = add_frame(
                 xi, yi, zi,  # I-End coordinates
                 xj, yj, zj,  # J-End coordinates
                 name,  # Name (will be assigned by ETABS)
-                col_geom.prop_name,  # Section property name
-                col_geom.name,  # User name
-                "Global"  # Coordinate system
+                prop_name,  # Section property name
+                user_name,  # User name
+                GLOBAL_CS  # Coordinate system
             )
 
             if ret[1] != 0:  # ret[1] is the error code
-                print(f"⚠️ Warning: Failed to create column {col_geom.name}. Error code: {ret[1]}")
+                failures.append((user_name or (xi, yi, zi), ret[1]))
             else:
                 created_count += 1
-
-        except Exception as e:
-            print(f"❌ Error creating column {col_geom.name}: {e}")
-
-    print(f"✅ Successfully created {created_count} columns in ETABS.")
+    except Exception as e:
+        logger.error("❌ Error creating columns (stopped after %d of %d): %s",
+                     created_count + len(failures), len(frame_args), e)
+
+    if failures:
+        logger.warning("⚠️ Failed to create %d/%d columns (name or first point, error code): %s",
+                       len(failures), len(frame_args), failures[:10])
+    logger.info("✅ Successfully created %d columns in ETABS.", created_count)
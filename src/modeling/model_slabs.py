@@ -1,7 +1,13 @@
+import logging
 from typing import List
 
+import numpy as np
+
+from modeling import GLOBAL_CS
 from models.geometry3d import SlabGeom
 
+logger = logging.getLogger(__name__)
+
 
 def create_slabs_in_etabs(sap_model, slab_geometries: List[SlabGeom],
                           sdl_name: str = "Dead", liveload_name: str = "Live"):
@@ -9,60 +15,88 @@ def create_slabs_in_etabs(sap_model, slab_geometries: List[SlabGeom],
     Create slab elements in ETABS using the AddByCoord method.
 
     Args:
-        :param sap_model: ETABS model object
+        :param sap_model: ETABS model object, already unlocked by the caller
         :param slab_geometries: List of SlabGeom objects
         :param sdl_name: Name of the sdl load pattern
         :param liveload_name: Name of the live load pattern
     """
     created_count = 0
+    failures: list[tuple] = []  # (user name or first point, error code)
+
+    # Flatten slabs into call arguments up front: point count, X/Y/Z, section,
+    # user name. Coordinates are float64 arrays, converted to lists in C.
+    area_args = [
+        (slab_geom.num_points,
+         slab_geom.x_coord.tolist(), slab_geom.y_coord.tolist(), slab_geom.z_coord.tolist(),
+         slab_geom.prop_name, slab_geom.name)
+        for slab_geom in slab_geometries
+    ]
+    count = len(area_args)
+    # Convert loads psf -> psi for all slabs in one vectorized pass
+    psf_to_psi = 1.0 / 144.0
+    sdl = np.fromiter((slab_geom.sdl for slab_geom in slab_geometries), dtype=np.float64, count=count)
+    live = np.fromiter((slab_geom.live for slab_geom in slab_geometries), dtype=np.float64, count=count)
+    sdl_psi = (sdl * psf_to_psi).tolist()
+    live_psi = (live * psf_to_psi).tolist()
+    add_area = sap_model.AreaObj.AddByCoord
+    set_load_uniform = sap_model.AreaObj.SetLoadUniform
 
-    for slab_geom in slab_geometries:
-        try:
+    etabs_names = [""] * count
+    created = np.zeros(count, dtype=bool)
+
+    try:
+        # --- 1. Create the slab areas ---
+        for i, (num_points, x_coord, y_coord, z_coord, prop_name, user_name) in enumerate(area_args):
             # Create slab using ETABS API
             name = ""  # Will be assigned by ETABS
-            returned = sap_model.AreaObj.AddByCoord(
-                slab_geom.num_points,
-                slab_geom.x_coord,
-                slab_geom.y_coord,
-                slab_geom.z_coord,
+            returned = add_area(
+                num_points,
+                x_coord,
+                y_coord,
+                z_coord,
                 name,  # Name (will be assigned by ETABS)
-                slab_geom.prop_name,  # Section property name
-                slab_geom.name,  # User name
-                "Global"  # Coordinate system
+                prop_name,  # Section property name
+                user_name,  # User name
+                GLOBAL_CS  # Coordinate system
             )
-            etabs_name = returned[-2]  # ret[-2] is the ETABS-assigned name
             if returned[-1] != 0:  # ret[-1] is the error code
-                print(f"⚠️ Warning: Failed to create slab {slab_geom.name}. Error code: {ret[1]}")
+                failures.append((user_name or next(zip(x_coord, y_coord, z_coord), None), returned[-1]))
             else:
+                etabs_names[i] = returned[-2]  # ret[-2] is the ETABS-assigned name
+                created[i] = True
                 created_count += 1
 
-            # Assign SDL and Live Load
-            Object = 0
-            sdl_value = slab_geom.sdl  # in psf
-            live_value = slab_geom.live  # in psf
-            if live_value > 0:
-                ret_live = sap_model.AreaObj.SetLoadUniform(
-                    etabs_name,
-                    liveload_name,
-                    live_value/144,  # convert psf to psi
-                    11,  # project gravity
-                    True,
-                    "Global",
-                    Object
-                )
+        # --- 2. Assign SDL and Live Load ---
+        # Partition once so the load loops only visit created slabs that carry a load
+        Object = 0
+        live_ids = np.flatnonzero(created & (live > 0)).tolist()
+        sdl_ids = np.flatnonzero(created & (sdl > 0)).tolist()
 
-            if sdl_value > 0:
-                ret_sdl = sap_model.AreaObj.SetLoadUniform(
-                    etabs_name,
-                    sdl_name,
-                    sdl_value/144,  # convert psf to psi
-                    11,  # project gravity
-                    True,
-                    "Global",
-                    Object
-                )
+        for i in live_ids:
+            set_load_uniform(
+                etabs_names[i],
+                liveload_name,
+                live_psi[i],
+                11,  # project gravity
+                True,
+                GLOBAL_CS,
+                Object
+            )
 
-        except Exception as e:
-            print(f"❌ Error creating slab {slab_geom.name}: {e}")
+        for i in sdl_ids:
+            set_load_uniform(
+                etabs_names[i],
+                sdl_name,
+                sdl_psi[i],
+                11,  # project gravity
+                True,
+                GLOBAL_CS,
+                Object
+            )
+    except Exception as e:
+        logger.error("❌ Error creating slabs (%d of %d created): %s", created_count, count, e)
 
-    print(f"✅ Successfully created {created_count} slabs in ETABS.")
+    if failures:
+        logger.warning("⚠️ Failed to create %d/%d slabs (name or first point, error code): %s",
+                       len(failures), count, failures[:10])
+    logger.info("✅ Successfully created %d slabs in ETABS.", created_count)
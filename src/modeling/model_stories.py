@@ -1,6 +1,15 @@
-import random
+import logging
+from array import array
+from operator import attrgetter
+
+import numpy as np
 
 from models.element_infor import Story
+from utils.units import M_TO_MM
+
+logger = logging.getLogger(__name__)
+
+_RNG = np.random.default_rng()
 
 
 def define_stories(sap_model, stories: list[Story], base_elevation: float):
@@ -13,21 +22,25 @@ def define_stories(sap_model, stories: list[Story], base_elevation: float):
         base_elevation: The elevation of the base level [ft].
     """
     if not stories:
-        print("⚠️ Warning: No stories provided to define.")
+        logger.warning("⚠️ No stories provided to define.")
         return
 
-    # Convert the list of dataclasses into the separate lists required by the ETABS API
-    story_names = [s.level for s in stories]
-    story_heights = [s.height*1000 for s in stories]
-    is_master_story = [s.is_master for s in stories]
-    similar_to_story = [s.similar_to for s in stories]
-    splice_above = [s.splice_above for s in stories]
-    splice_height = [s.splice_height*1000 for s in stories]
-    colors = [s.color for s in stories]
+    # Convert the list of dataclasses into the separate arrays required by the ETABS API,
+    # reading every field of a story in one pass and transposing with zip. The tuples
+    # zip produces are passed as-is: fixed length, no copy back into lists.
+    get_story_fields = attrgetter('level', 'height', 'is_master', 'similar_to', 'splice_above', 'splice_height')
+    story_names, heights, is_master_story, similar_to_story, splice_above, splice_heights = zip(
+        *map(get_story_fields, stories))
+
+    # Heights go into typed double buffers (scaled m -> mm while filling) so comtypes
+    # builds the SAFEARRAY(double) from contiguous memory instead of boxed floats.
+    scale = M_TO_MM
+    story_heights = array('d', (h*scale for h in heights))
+    splice_height = array('d', (h*scale for h in splice_heights))
 
     # Call the ETABS API function with the new base_elevation parameter
     returned_values = sap_model.Story.SetStories_2(
-        base_elevation*1000,
+        base_elevation*scale,
         len(stories),
         story_names,
         story_heights,
@@ -43,7 +56,7 @@ def define_stories(sap_model, stories: list[Story], base_elevation: float):
     if ret != 0:
         raise Exception(f"❌ ETABS API failed to define stories. Error code: {ret}")
     else:
-        print(f"✅ Successfully defined {len(stories)} stories with base elevation at {base_elevation} ft.")
+        logger.info("✅ Successfully defined %d stories with base elevation at %s ft.", len(stories), base_elevation)
 
 
 def generate_color_list(length: int) -> list[int]:
@@ -62,4 +75,4 @@ def generate_color_list(length: int) -> list[int]:
     if length < 0:
         raise ValueError("Length must be non-negative.")
 
-    return [random.randint(0, 16777215) for _ in range(length)]
+    return _RNG.integers(0, 16777216, size=length, dtype=np.int64).tolist()
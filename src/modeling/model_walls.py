@@ -1,39 +1,57 @@
+import logging
 from typing import List
 
+from modeling import GLOBAL_CS
 from models.geometry3d import WallGeom
 
+logger = logging.getLogger(__name__)
+
 
 def create_walls_in_etabs(sap_model, wall_geometries: List[WallGeom]):
     """
     Create wall elements in ETABS using the AddByCoord method.
 
     Args:
-        sap_model: ETABS model object
+        sap_model: ETABS model object, already unlocked by the caller
         wall_geometries: List of WallGeom objects
     """
     created_count = 0
-
-    for wall_geom in wall_geometries:
-        try:
+    failures: list[tuple] = []  # (user name or first point, error code)
+
+    # Flatten walls into call arguments up front: point count, X/Y/Z, section,
+    # user name. Coordinates are float64 arrays, converted to lists in C.
+    area_args = [
+        (wall_geom.num_points,
+         wall_geom.x_coord.tolist(), wall_geom.y_coord.tolist(), wall_geom.z_coord.tolist(),
+         wall_geom.prop_name, wall_geom.name)
+        for wall_geom in wall_geometries
+    ]
+    add_area = sap_model.AreaObj.AddByCoord
+
+    try:
+        for num_points, x_coord, y_coord, z_coord, prop_name, user_name in area_args:
             # Create wall using ETABS API
             name = ""  # Will be assigned by ETABS
-            returned = sap_model.AreaObj.AddByCoord(
-                wall_geom.num_points,
-                wall_geom.x_coord,
-                wall_geom.y_coord,
-                wall_geom.z_coord,
+            returned = add_area(
+                num_points,
+                x_coord,
+                y_coord,
+                z_coord,
                 name,  # Name (will be assigned by ETABS)
-                wall_geom.prop_name,  # Section property name
-                wall_geom.name,  # User name
-                "Global"  # Coordinate system
+                prop_name,  # Section property name
+                user_name,  # User name
+                GLOBAL_CS  # Coordinate system
             )
 
-            if returned[-1] != 0:  # ret[1] is the error code
-                print(f"⚠️ Warning: Failed to create wall {wall_geom.name}. Error code: {ret[1]}")
+            if returned[-1] != 0:  # ret[-1] is the error code
+                failures.append((user_name or next(zip(x_coord, y_coord, z_coord), None), returned[-1]))
             else:
                 created_count += 1
-
-        except Exception as e:
-            print(f"❌ Error creating wall {wall_geom.name}: {e}")
-
-    print(f"✅ Successfully created {created_count} walls in ETABS.")
\ No newline at end of file
+    except Exception as e:
+        logger.error("❌ Error creating walls (stopped after %d of %d): %s",
+                     created_count + len(failures), len(area_args), e)
+
+    if failures:
+        logger.warning("⚠️ Failed to create %d/%d walls (name or first point, error code): %s",
+                       len(failures), len(area_args), failures[:10])
+    logger.info("✅ Successfully created %d walls in ETABS.", created_count)
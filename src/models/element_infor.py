@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Story:
     level: str
     height: float  # in ft for now
@@ -13,7 +13,7 @@ class Story:
     color: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Concrete:
     name: str
     fc: float  # Compressive strength (f'c), e.g., in MPa
@@ -29,7 +29,7 @@ class Concrete:
     ultimate_strain: float = 0.005  # Ultimate crushing strain for concrete
 
 
-@dataclass
+@dataclass(slots=True)
 class RectColumn:
     level: str
     name: str
@@ -48,7 +48,7 @@ class RectColumn:
     tie_legs_3dir: int
 
 
-@dataclass
+@dataclass(slots=True)
 class CircColumn:
     level: str
     name: str
@@ -63,7 +63,7 @@ class CircColumn:
     tie_spacing: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Wall:
     level: str
     name: str
@@ -73,7 +73,7 @@ class Wall:
     shell_type: int = 1  # 1= shellThin
 
 
-@dataclass
+@dataclass(slots=True)
 class CouplingBeam:
     level: str
     name: str
@@ -90,7 +90,7 @@ class CouplingBeam:
     bot_right_area: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Slab:
     level: str
     name: str
@@ -1,10 +1,19 @@
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Tuple
+
+import numpy as np
 
 Point3D = Tuple[float, float, float]
 
 
-@dataclass
+def _set_coord_arrays(geom):
+    # Store area coordinates as contiguous float64 so they pack without boxing
+    geom.x_coord = np.ascontiguousarray(geom.x_coord, dtype=np.float64)
+    geom.y_coord = np.ascontiguousarray(geom.y_coord, dtype=np.float64)
+    geom.z_coord = np.ascontiguousarray(geom.z_coord, dtype=np.float64)
+
+
+@dataclass(slots=True, frozen=True)
 class ColumnGeom:
     start_point: Point3D
     end_point: Point3D
@@ -12,7 +21,7 @@ class ColumnGeom:
     name: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BeamGeom:
     start_point: Point3D
     end_point: Point3D
@@ -20,23 +29,30 @@ class BeamGeom:
     name: str = ""
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class WallGeom:
     num_points: int
-    x_coord: List[float]
-    y_coord: List[float]
-    z_coord: List[float]
+    x_coord: np.ndarray  # float64, accepts any sequence of floats
+    y_coord: np.ndarray
+    z_coord: np.ndarray
     prop_name: str
     name: str = ""
 
+    def __post_init__(self):
+        _set_coord_arrays(self)
 
-@dataclass
+
+@dataclass(slots=True, eq=False)
 class SlabGeom:
     num_points: int
-    x_coord: List[float]
-    y_coord: List[float]
-    z_coord: List[float]
+    x_coord: np.ndarray  # float64, accepts any sequence of floats
+    y_coord: np.ndarray
+    z_coord: np.ndarray
     prop_name: str
     name: str = ""
     sdl: float = 0.0  # in psf
     live: float = 0.0  # in psf
+
+    def __post_init__(self):
+        _set_coord_arrays(self)
+
@@ -1,25 +1,26 @@
+import logging
+
 from models.element_infor import CouplingBeam
+from utils.name_cache import NameCache
+
+logger = logging.getLogger(__name__)
 
 
-def define_beam_sections(sap_model, beams: list[CouplingBeam]):
+def define_beam_sections(sap_model, beams: list[CouplingBeam], name_cache: NameCache | None = None):
+    # Keep the first definition of each name, in sheet order
     unique_beams = {}
     for beam in beams:
-        if beam.name not in unique_beams:
-            unique_beams[beam.name] = beam
-
-    # Get the list of existing frame property names
-    _, existing_names, ret = sap_model.PropFrame.GetNameList(0, [])
-    if ret != 0:
-        raise Exception(f"Failed to retrieve frame property names. Error code: {ret}")
+        unique_beams.setdefault(beam.name, beam)
 
-    existing_set = set(existing_names)
+    # Existing frame property names, fetched from ETABS at most once per build
+    if name_cache is None:
+        name_cache = NameCache(sap_model)
+    existing_set = name_cache.frame_names()
 
-    defined_count = 0
-    for beam in unique_beams.values():
-        if beam.name in existing_set:
-            # Beam section already exists, skip creation
-            continue
+    # Only sections that do not exist in the model yet need to be created
+    new_beams = [beam for beam in unique_beams.values() if beam.name not in existing_set]
 
+    for beam in new_beams:
         # Define the rectangular geometry
         ret = sap_model.PropFrame.SetRectangle(
             beam.name,
@@ -45,6 +46,6 @@ def define_beam_sections(sap_model, beams: list[CouplingBeam]):
         if ret != 0:
             raise Exception(f"Failed to assign rebar to beam section {beam.name}. Error code: {ret}")
 
-        defined_count += 1
+        existing_set.add(beam.name)
 
-    print(f"Successfully defined {defined_count} new unique beam sections (total unique: {len(unique_beams)}).")
\ No newline at end of file
+    logger.info("Successfully defined %d new unique beam sections (total unique: %d).", len(new_beams), len(unique_beams))
\ No newline at end of file
@@ -1,7 +1,11 @@
+import logging
 from typing import List
 
 from models.element_infor import CircColumn
 
+logger = logging.getLogger(__name__)
+
+
 def define_circular_sections(sap_model, columns: List[CircColumn]):
     """
     Defines multiple circular frame sections in the model from a list of CircColumn objects.
@@ -18,7 +22,7 @@ def define_circular_sections(sap_model, columns: List[CircColumn]):
             if ret != 0:
                 raise Exception(f"Failed to define section geometry (Error code: {ret})")
 
-            print(f"✅ Defined section: {column.name} (Ø {column.dia})")
+            logger.info("✅ Defined section: %s (Ø %s)", column.name, column.dia)
 
             # 2. Assign reinforcement
             ret = sap_model.PropFrame.SetRebarColumn(
@@ -41,7 +45,7 @@ def define_circular_sections(sap_model, columns: List[CircColumn]):
             if ret != 0:
                 raise Exception(f"Failed to assign rebar (Error code: {ret})")
 
-            print(f"   ... Assigned rebar to {column.name}.")
+            logger.debug("   ... Assigned rebar to %s.", column.name)
 
         except Exception as e:
-            print(f"❌ ERROR defining circular section '{column.name}': {e}")
\ No newline at end of file
+            logger.error("❌ ERROR defining circular section '%s': %s", column.name, e)
\ No newline at end of file
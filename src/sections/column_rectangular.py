@@ -1,7 +1,10 @@
+import logging
 from typing import List
 
 from models.element_infor import RectColumn
 
+logger = logging.getLogger(__name__)
+
 
 # Make sure RectColumn dataclass is imported
 # from models.element_infor import RectColumn
@@ -22,7 +25,7 @@ def define_rectangular_sections(sap_model, columns: List[RectColumn]):
             if ret != 0:
                 raise Exception(f"Failed to define section geometry (Error code: {ret})")
 
-            print(f"✅ Defined section: {column.name} ({column.b}x{column.h})")
+            logger.info("✅ Defined section: %s (%sx%s)", column.name, column.b, column.h)
 
             # 2. Assign reinforcement
             ret = sap_model.PropFrame.SetRebarColumn(
@@ -45,7 +48,7 @@ def define_rectangular_sections(sap_model, columns: List[RectColumn]):
             if ret != 0:
                 raise Exception(f"Failed to assign rebar (Error code: {ret})")
 
-            print(f"   ... Assigned rebar to {column.name}.")
+            logger.debug("   ... Assigned rebar to %s.", column.name)
 
         except Exception as e:
-            print(f"❌ ERROR defining rectangular section '{column.name}': {e}")
\ No newline at end of file
+            logger.error("❌ ERROR defining rectangular section '%s': %s", column.name, e)
\ No newline at end of file
@@ -1,25 +1,26 @@
+import logging
+
 from models.element_infor import Slab
+from utils.name_cache import NameCache
+
+logger = logging.getLogger(__name__)
 
 
-def define_slab_sections(sap_model, slabs: list[Slab]):
+def define_slab_sections(sap_model, slabs: list[Slab], name_cache: NameCache | None = None):
+    # Keep the first definition of each name, in sheet order
     unique_slabs = {}
     for slab in slabs:
-        if slab.name not in unique_slabs:
-            unique_slabs[slab.name] = slab
-
-    # Get the list of existing shell property names
-    _, existing_names, ret = sap_model.PropArea.GetNameList(0, [], 1)
-    if ret != 0:
-        raise Exception(f"Failed to retrieve shell property names. Error code: {ret}")
+        unique_slabs.setdefault(slab.name, slab)
 
-    existing_set = set(existing_names)
+    # Existing shell property names, fetched from ETABS at most once per build
+    if name_cache is None:
+        name_cache = NameCache(sap_model)
+    existing_set = name_cache.area_names()
 
-    defined_count = 0
-    for slab in unique_slabs.values():
-        if slab.name in existing_set:
-            # Slab section already exists, skip creation
-            continue
+    # Only sections that do not exist in the model yet need to be created
+    new_slabs = [slab for slab in unique_slabs.values() if slab.name not in existing_set]
 
+    for slab in new_slabs:
         # Define the slab section
         ret = sap_model.PropArea.SetSlab(
             slab.name,
@@ -31,6 +32,6 @@ def define_slab_sections(sap_model, slabs: list[Slab]):
         )
         if ret != 0:
             raise Exception(f"Failed to define slab section {slab.name}. Error code: {ret}")
-        defined_count += 1
+        existing_set.add(slab.name)
 
-    print(f"Successfully defined {defined_count} new unique slab sections (total unique: {len(unique_slabs)}).")
\ No newline at end of file
+    logger.info("Successfully defined %d new unique slab sections (total unique: %d).", len(new_slabs), len(unique_slabs))
\ No newline at end of file
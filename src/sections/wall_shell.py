@@ -1,25 +1,26 @@
+import logging
+
 from models.element_infor import Wall
+from utils.name_cache import NameCache
+
+logger = logging.getLogger(__name__)
 
 
-def define_wall_sections(sap_model, walls: list[Wall]):
+def define_wall_sections(sap_model, walls: list[Wall], name_cache: NameCache | None = None):
+    # Keep the first definition of each name, in sheet order
     unique_walls = {}
     for wall in walls:
-        if wall.name not in unique_walls:
-            unique_walls[wall.name] = wall
-
-    # Get the list of existing shell property names
-    _, existing_names, ret = sap_model.PropArea.GetNameList(0, [], 1)
-    if ret != 0:
-        raise Exception(f"Failed to retrieve shell property names. Error code: {ret}")
+        unique_walls.setdefault(wall.name, wall)
 
-    existing_set = set(existing_names)
+    # Existing shell property names, fetched from ETABS at most once per build
+    if name_cache is None:
+        name_cache = NameCache(sap_model)
+    existing_set = name_cache.area_names()
 
-    defined_count = 0
-    for wall in unique_walls.values():
-        if wall.name in existing_set:
-            # Wall section already exists, skip creation
-            continue
+    # Only sections that do not exist in the model yet need to be created
+    new_walls = [wall for wall in unique_walls.values() if wall.name not in existing_set]
 
+    for wall in new_walls:
         # Define the wall section
         ret = sap_model.PropArea.SetWall(
             wall.name,
@@ -30,6 +31,6 @@ def define_wall_sections(sap_model, walls: list[Wall]):
         )
         if ret != 0:
             raise Exception(f"Failed to define wall section {wall.name}. Error code: {ret}")
-        defined_count += 1
+        existing_set.add(wall.name)
 
-    print(f"Successfully defined {defined_count} new unique wall sections (total unique: {len(unique_walls)}).")
\ No newline at end of file
+    logger.info("Successfully defined %d new unique wall sections (total unique: %d).", len(new_walls), len(unique_walls))
\ No newline at end of file
@@ -17,10 +17,8 @@ from sections.column_circle import define_circular_sections
 from sections.column_rectangular import define_rectangular_sections
 from sections.slab_shell import define_slab_sections
 from sections.wall_shell import define_wall_sections
-from utils.excel_processing import (read_story_table, read_concrete_table,
-                                    read_rectangular_column_table,
-                                    read_circular_column_table, read_wall_table,
-                                    read_coupling_beam_table, read_slab_table)
+from utils.excel_processing import read_all_tables
+from utils.name_cache import NameCache
 from utils.level_by_level_extruder import process_all_levels
 
 
@@ -40,6 +38,7 @@ def etabs_model_builder_level_by_level():
     # ============================================
     print("\n🔌 Connecting to ETABS...")
     sap_model = connect_to_etabs()
+    sap_model.SetModelIsLocked(False)  # Unlock once for the whole build
     sap_model.SetPresentUnits(9)  # N_mm_C units
     base_elevation = -18  # Base elevation in meters
     print("✅ Connected to ETABS")
@@ -50,13 +49,14 @@ def etabs_model_builder_level_by_level():
     print("\n📊 Reading Excel data...")
     excel_path = r"C:\Work\Code\EtabsModeling\src\data\Input Data_V02_metric.xlsx"
 
-    stories = read_story_table(excel_path)
-    concretes = read_concrete_table(excel_path)
-    rect_columns = read_rectangular_column_table(excel_path)
-    cir_columns = read_circular_column_table(excel_path)
-    walls = read_wall_table(excel_path)
-    coupling_beams = read_coupling_beam_table(excel_path)
-    slabs = read_slab_table(excel_path)
+    tables = read_all_tables(excel_path)
+    stories = tables.stories
+    concretes = tables.concretes
+    rect_columns = tables.rect_columns
+    cir_columns = tables.circ_columns
+    walls = tables.walls
+    coupling_beams = tables.coupling_beams
+    slabs = tables.slabs
 
     print(f"✅ Read data for {len(stories)} stories")
 
@@ -65,12 +65,13 @@ def etabs_model_builder_level_by_level():
     # ============================================
     print("\n🏗️ Defining stories and material properties in ETABS...")
     define_stories(sap_model, stories, base_elevation)
-    define_concrete_materials(sap_model, concretes)
+    name_cache = NameCache(sap_model)
+    define_concrete_materials(sap_model, concretes, name_cache)
     define_rectangular_sections(sap_model, rect_columns)
     define_circular_sections(sap_model, cir_columns)
-    define_wall_sections(sap_model, walls)
-    define_beam_sections(sap_model, coupling_beams)
-    define_slab_sections(sap_model, slabs)
+    define_wall_sections(sap_model, walls, name_cache)
+    define_beam_sections(sap_model, coupling_beams, name_cache)
+    define_slab_sections(sap_model, slabs, name_cache)
     print("✅ Stories and properties defined")
 
     # ============================================
@@ -78,6 +79,8 @@ def etabs_model_builder_level_by_level():
     # ============================================
     print("\n📐 Processing DXF files for each level...")
 
+    # Parsed plans and their entity indexes, shared between stories using the same DXF file
+    dxf_cache = {}
     all_columns, all_walls, all_beams, all_slabs = process_all_levels(
         stories=stories,
         base_elevation=base_elevation,
@@ -85,8 +88,11 @@ def etabs_model_builder_level_by_level():
         circ_columns=cir_columns,
         walls=walls,
         beams=coupling_beams,
-        slabs=slabs
+        slabs=slabs,
+        dxf_cache=dxf_cache
     )
+    # Release the parsed plans and their indexes once every level is extruded
+    dxf_cache.clear()
 
     # ============================================
     # STEP 5: Create Elements in ETABS
@@ -10,9 +10,9 @@ from sections.column_circle import define_circular_sections
 from sections.column_rectangular import define_rectangular_sections
 from sections.slab_shell import define_slab_sections
 from sections.wall_shell import define_wall_sections
-from utils.dxf_processing import read_dxf_plan, get_points_by_layer, get_lines_by_layer, get_polylines_by_layer
-from utils.excel_processing import read_story_table, read_concrete_table, read_rectangular_column_table, \
-    read_circular_column_table, read_wall_table, read_coupling_beam_table, read_slab_table
+from utils.dxf_processing import read_dxf_plan, collect_by_layer
+from utils.excel_processing import read_all_tables
+from utils.name_cache import NameCache
 from utils.extruder import extrude_points_to_columns, extrude_lines_to_walls, extrude_polylines_to_slabs, \
     extrude_lines_to_beams
 
@@ -23,39 +23,50 @@ def etabs_model_builder():
     """
     # Connect to ETABS
     sap_model = connect_to_etabs()
+    sap_model.SetModelIsLocked(False)  # Unlock once for the whole build
     sap_model.SetPresentUnits(9)  # n_mm_C units
     base_elevation = -18  # Base elevation in feet
 
     # Read data from Excel
     excel_path = r"data/Input Data_V02_metric.xlsx"
-    stories = read_story_table(excel_path)
-    concretes = read_concrete_table(excel_path)
-    rect_columns = read_rectangular_column_table(excel_path)
-    cir_columns = read_circular_column_table(excel_path)
-    walls = read_wall_table(excel_path)
-    coupling_beams = read_coupling_beam_table(excel_path)
-    slabs = read_slab_table(excel_path)
+    tables = read_all_tables(excel_path)
+    stories = tables.stories
+    concretes = tables.concretes
+    rect_columns = tables.rect_columns
+    cir_columns = tables.circ_columns
+    walls = tables.walls
+    coupling_beams = tables.coupling_beams
+    slabs = tables.slabs
 
     # Define properties in ETABS
     define_stories(sap_model, stories, base_elevation)
-    define_concrete_materials(sap_model, concretes)
+    name_cache = NameCache(sap_model)
+    define_concrete_materials(sap_model, concretes, name_cache)
     define_rectangular_sections(sap_model, rect_columns)
     define_circular_sections(sap_model, cir_columns)
-    define_wall_sections(sap_model, walls)
-    define_beam_sections(sap_model, coupling_beams)
-    define_slab_sections(sap_model, slabs)
+    define_wall_sections(sap_model, walls, name_cache)
+    define_beam_sections(sap_model, coupling_beams, name_cache)
+    define_slab_sections(sap_model, slabs, name_cache)
 
     # Read geometry from DXF
     dxf_path = r"C:\Work\Project\KPF Tower\plan_tower.dxf"
     doc = read_dxf_plan(dxf_path)
 
-    # Get 2D geometry data
-    cir_column_locations = get_points_by_layer(doc, "CIR COLS")
-    rect_column_locations = get_points_by_layer(doc, "REC COLS")
-    coupling_beam_y_location = get_lines_by_layer(doc, "CB X")
-    wall_x_locations = get_lines_by_layer(doc, "WALL X")
-    wall_y_locations = get_lines_by_layer(doc, "WALL Y")
-    slab_polylines = get_polylines_by_layer(doc, "SLAB")  # Assuming these are polylines
+    # Get 2D geometry data, reading every layer in one pass over modelspace
+    layers = collect_by_layer(doc, {
+        "CIR COLS": {"POINT"},
+        "REC COLS": {"POINT"},
+        "CB X": {"LINE"},
+        "WALL X": {"LINE"},
+        "WALL Y": {"LINE"},
+        "SLAB": {"LWPOLYLINE", "POLYLINE"},  # Assuming these are polylines
+    })
+    cir_column_locations = layers["CIR COLS"]
+    rect_column_locations = layers["REC COLS"]
+    coupling_beam_y_location = layers["CB X"]
+    wall_x_locations = layers["WALL X"]
+    wall_y_locations = layers["WALL Y"]
+    slab_polylines = layers["SLAB"]
 
     # Extrude geometry to 3D with section assignments
     rect_column_geoms = extrude_points_to_columns(
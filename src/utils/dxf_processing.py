@@ -1,21 +1,65 @@
+import logging
+import os
 import sys
-import comtypes
+
 import ezdxf
+import numpy as np
 from ezdxf.document import Drawing
 
+logger = logging.getLogger(__name__)
+
+# Modelspace entities grouped by layer name
+EntityIndex = dict[str, list]
+
+# Parsed documents and their entity indexes keyed by (path, mtime); stories often
+# share one plan DXF. The caller creates one for a build and clears it to release
+# the documents.
+DxfCache = dict[tuple[str, float], tuple[Drawing, EntityIndex]]
+
 
 # ---------- DXF I/O ----------
-def read_dxf_plan(path: str) -> Drawing:
+def _read_dxf(path: str) -> Drawing:
     try:
         doc = ezdxf.readfile(path)
-        print(f"Reading DXF plan: {path}")
+        logger.info("Reading DXF plan: %s", path)
         return doc
-    except (IOError, comtypes.COMError):
+    except OSError:
         sys.exit("Not a DXF file or a generic I/O error.")
     except ezdxf.DXFStructureError:
         sys.exit("Invalid or corrupt DXF file.")
 
 
+def read_dxf_plan(path: str, cache: DxfCache | None = None) -> Drawing:
+    """
+    Read a DXF file.
+
+    When a cache is given, the parsed document is reused while the file is unchanged;
+    it is then shared between callers and must be treated as read-only, and it stays
+    in memory until the cache entry is removed. Without a cache nothing is kept.
+    """
+    if cache is None:
+        return _read_dxf(path)
+    return load_dxf_plan(path, cache)[0]
+
+
+def load_dxf_plan(path: str, cache: DxfCache) -> tuple[Drawing, EntityIndex]:
+    """
+    Read a DXF file together with its entity index, reusing both while the file is unchanged.
+
+    The document and index live only in the caller's cache, so clearing the cache
+    releases them. Cached documents are shared and must be treated as read-only.
+    """
+    try:
+        key = (path, os.path.getmtime(path))
+    except OSError:
+        sys.exit("Not a DXF file or a generic I/O error.")
+    entry = cache.get(key)
+    if entry is None:
+        doc = _read_dxf(path)
+        entry = cache[key] = (doc, build_entity_index(doc))
+    return entry
+
+
 def get_model_space(doc: Drawing):
     try:
         return doc.modelspace()
@@ -24,40 +68,115 @@ def get_model_space(doc: Drawing):
 
 
 # ---------- Base extractors ----------
-def get_points_by_layer(doc: Drawing, layer: str):
-    msp = get_model_space(doc)
-    return [
-        (pt.dxf.location.x, pt.dxf.location.y, pt.dxf.location.z)
-        for pt in msp.query(f'POINT[layer=="{layer}"]')
-    ]
+def _point_coords(e):
+    loc = e.dxf.location
+    return loc.x, loc.y, loc.z
+
+
+def _line_coords(e):
+    start, end = e.dxf.start, e.dxf.end
+    return (start.x, start.y, start.z), (end.x, end.y, end.z)
+
+
+def _lwpolyline_coords(e):
+    return [(x, y, 0.0) for x, y, *_ in e.get_points()]  # (x, y, start_width, end_width, bulge)
+
+
+def _polyline_coords(e):
+    return [(v.dxf.location.x, v.dxf.location.y, v.dxf.location.z) for v in e.vertices]
+
 
+# Array shape of each entity type that has a fixed vertex count
+_ARRAY_SHAPES = {
+    "POINT": (-1, 3),
+    "LINE": (-1, 2, 3),
+}
 
-def get_lines_by_layer(doc: Drawing, layer: str):
-    msp = get_model_space(doc)
-    return [
-        ((e.dxf.start.x, e.dxf.start.y, e.dxf.start.z),
-         (e.dxf.end.x, e.dxf.end.y, e.dxf.end.z))
-        for e in msp.query("LINE") if e.dxf.layer == layer
-    ]
+_EXTRACTORS = {
+    "POINT": _point_coords,
+    "LINE": _line_coords,
+    "LWPOLYLINE": _lwpolyline_coords,
+    "POLYLINE": _polyline_coords,
+}
 
 
-def get_polylines_by_layer(doc: Drawing, layer: str, closed_only: bool = False):
-    msp = doc.modelspace()
+def build_entity_index(doc: Drawing) -> EntityIndex:
+    """
+    Group the supported modelspace entities by layer in a single pass.
+
+    Layer queries given the index reuse it instead of scanning modelspace again.
+    Entities keep their modelspace order within each layer.
+    """
+    index = {}
+    for e in get_model_space(doc):
+        if e.dxftype() in _EXTRACTORS:
+            index.setdefault(e.dxf.layer, []).append(e)
+    return index
+
+
+def _layer_entities(doc: Drawing, layer: str, dxftypes: tuple[str, ...], index: EntityIndex | None):
+    if index is None:
+        # Without an index, a single scan of modelspace for this layer is cheapest
+        return [e for e in get_model_space(doc) if e.dxftype() in dxftypes and e.dxf.layer == layer]
+    return [e for e in index.get(layer, ()) if e.dxftype() in dxftypes]
+
+
+def get_points_by_layer(doc: Drawing, layer: str, index: EntityIndex | None = None) -> np.ndarray:
+    """Return the POINT locations on a layer as an (N, 3) float64 array, using ``index`` if given."""
+    coords = np.fromiter(
+        (v for pt in _layer_entities(doc, layer, ("POINT",), index) for v in _point_coords(pt)),
+        dtype=np.float64
+    )
+    return coords.reshape(_ARRAY_SHAPES["POINT"])
+
+
+def get_lines_by_layer(doc: Drawing, layer: str, index: EntityIndex | None = None) -> np.ndarray:
+    """Return the LINE start/end points on a layer as an (N, 2, 3) float64 array, using ``index`` if given."""
+    coords = np.fromiter(
+        (v for e in _layer_entities(doc, layer, ("LINE",), index) for pt in _line_coords(e) for v in pt),
+        dtype=np.float64
+    )
+    return coords.reshape(_ARRAY_SHAPES["LINE"])
+
+
+def get_polylines_by_layer(doc: Drawing, layer: str, closed_only: bool = False, index: EntityIndex | None = None):
     polys = []
 
-    for e in msp.query("LWPOLYLINE POLYLINE"):
-        if e.dxf.layer != layer:
-            continue
+    for e in _layer_entities(doc, layer, ("LWPOLYLINE", "POLYLINE"), index):
         if closed_only and not e.closed:
             continue
 
-        if e.dxftype() == "LWPOLYLINE":
-            pts = [(x, y, 0.0) for x, y, *_ in e.get_points()]  # (x, y, start_width, end_width, bulge)
-        elif e.dxftype() == "POLYLINE":
-            pts = [(v.dxf.location.x, v.dxf.location.y, v.dxf.location.z) for v in e.vertices]
-        else:
-            continue
-
-        polys.append(pts)
+        polys.append(_EXTRACTORS[e.dxftype()](e))
 
     return polys
+
+
+def collect_by_layer(doc: Drawing, spec: dict[str, set[str]], index: EntityIndex | None = None) -> dict[str, list]:
+    """
+    Extract the geometry of several layers from the document's entity index.
+
+    Args:
+        doc: DXF document
+        spec: Layer name -> entity types to keep, e.g. {"WALL X": {"LINE"}}.
+              Supported types are POINT, LINE, LWPOLYLINE and POLYLINE.
+        index: Entity index of doc; built here if omitted
+
+    Returns:
+        Layer name -> coordinates, in the same shape the matching get_*_by_layer
+        function returns: float64 arrays for POINT or LINE layers, lists of
+        vertex lists for polylines
+    """
+    if index is None:
+        index = build_entity_index(doc)
+    found = {}
+
+    for layer, kinds in spec.items():
+        found[layer] = [
+            _EXTRACTORS[e.dxftype()](e) for e in index.get(layer, ()) if e.dxftype() in kinds
+        ]
+        if len(kinds) == 1:
+            shape = _ARRAY_SHAPES.get(next(iter(kinds)))
+            if shape is not None:
+                found[layer] = np.array(found[layer], dtype=np.float64).reshape(shape)
+
+    return found
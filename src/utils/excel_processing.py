@@ -1,9 +1,93 @@
 # excel_processing.py
 
-from typing import List
+import logging
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, List, TypeVar
+
 from openpyxl import load_workbook
 from models.element_infor import Story, RectColumn, Wall, CouplingBeam, Slab, Concrete, CircColumn
 
+try:  # Optional Rust-based reader (pip install etabsmodeling[calamine])
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+Row = tuple
+
+# Number of leading columns each parser reads from its sheet
+_STORY_COLS = 3
+_CONCRETE_COLS = 3
+_RECT_COLUMN_COLS = 16
+_CIRC_COLUMN_COLS = 12
+_WALL_COLS = 7
+_COUPLING_BEAM_COLS = 9
+_SLAB_COLS = 6
+
+
+@dataclass
+class InputTables:
+    """All input tables read from a single pass over the workbook."""
+    stories: List[Story]
+    concretes: List[Concrete]
+    rect_columns: List[RectColumn]
+    circ_columns: List[CircColumn]
+    walls: List[Wall]
+    coupling_beams: List[CouplingBeam]
+    slabs: List[Slab]
+
+
+def _calamine_value(value):
+    # Match openpyxl's cell values: empty cells are None, whole numbers are int
+    if value == "":
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _calamine_rows(wb, sheet: str, max_col: int) -> Iterable[Row]:
+    # Keep leading empty rows so the header offset matches openpyxl
+    rows = wb.get_sheet_by_name(sheet).to_python(skip_empty_area=False)
+    # Skip header rows (first 2 rows are headers); pad/trim to max_col like openpyxl
+    pad = ("",) * max_col
+    return (tuple(_calamine_value(v) for v in (*row, *pad)[:max_col]) for row in rows[2:])
+
+
+def _openpyxl_rows(wb, sheet: str, max_col: int) -> Iterable[Row]:
+    # Skip header rows (first 2 rows are headers). Bounding the columns keeps
+    # openpyxl from walking inflated sheet dimensions past the data we use.
+    return wb[sheet].iter_rows(min_row=3, max_col=max_col, values_only=True)
+
+
+@contextmanager
+def _open_workbook(path: str) -> Iterator[Callable[[str, int], Iterable[Row]]]:
+    """
+    Open the workbook once and yield a function returning the data rows of a sheet,
+    limited to its first ``max_col`` columns.
+
+    Uses python-calamine when it is installed, otherwise openpyxl in read-only mode.
+    """
+    if CalamineWorkbook is not None:
+        with CalamineWorkbook.from_path(path) as wb:
+            yield lambda sheet, max_col: _calamine_rows(wb, sheet, max_col)
+        return
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        yield lambda sheet, max_col: _openpyxl_rows(wb, sheet, max_col)
+    finally:
+        wb.close()
+
+
+def _read_sheet(path: str, sheet: str, parse: Callable[[Iterable[Row]], List[T]], max_col: int) -> List[T]:
+    """Open the workbook and parse the data rows of one sheet."""
+    with _open_workbook(path) as sheet_rows:
+        return parse(sheet_rows(sheet, max_col))
+
 
 # ---------- STORY ----------
 def read_story_table(path: str, sheet: str = "Story") -> List[Story]:
@@ -16,12 +100,14 @@ def read_story_table(path: str, sheet: str = "Story") -> List[Story]:
     - Height (float): Story height in meters
     - DXF_Path (str): Path to DXF file for this level (optional)
     """
-    wb = load_workbook(path, data_only=True)
-    ws = wb[sheet]
+    stories = _read_sheet(path, sheet, _parse_story_rows, _STORY_COLS)
+    _log_story_summary(stories, sheet)
+    return stories
+
 
+def _parse_story_rows(rows: Iterable[Row]) -> List[Story]:
     stories: List[Story] = []
-    # Start from the third row to skip headers
-    for row in ws.iter_rows(min_row=3, values_only=True):
+    for row in rows:
         if not row[0]:  # Stop if the level name is blank
             continue
 
@@ -37,12 +123,14 @@ def read_story_table(path: str, sheet: str = "Story") -> List[Story]:
     # IMPORTANT: Reverse the list because ETABS requires stories
     # to be defined from the bottom up (e.g., L1, L2, L3...)
     stories.reverse()
-
-    print(
-        f"✅ Read {len(stories)} stories from '{sheet}'. First story: '{stories[0].level}', Last story: '{stories[-1].level}'.")
     return stories
 
 
+def _log_story_summary(stories: List[Story], sheet: str):
+    logger.info("✅ Read %d stories from '%s'. First story: '%s', Last story: '%s'.",
+                len(stories), sheet, stories[0].level, stories[-1].level)
+
+
 # ---------- STORY ----------
 def read_concrete_table(path: str, sheet_name: str = "Material") -> List[Concrete]:
     """
@@ -57,13 +145,12 @@ def read_concrete_table(path: str, sheet_name: str = "Material") -> List[Concret
     :param sheet_name: Name of sheet containing material table
     :return: List of Concrete dataclass objects
     """
-    wb = load_workbook(path, data_only=True)
-    ws = wb[sheet_name]
+    return _read_sheet(path, sheet_name, _parse_concrete_rows, _CONCRETE_COLS)
 
-    concretes: List[Concrete] = []
 
-    # Skip header rows (assume first 2 rows are headers)
-    for row in ws.iter_rows(min_row=3, values_only=True):
+def _parse_concrete_rows(rows: Iterable[Row]) -> List[Concrete]:
+    concretes: List[Concrete] = []
+    for row in rows:
         if row[0] is None:
             continue
         name = str(row[0]).strip()
@@ -76,11 +163,12 @@ def read_concrete_table(path: str, sheet_name: str = "Material") -> List[Concret
 
 # ----------RECTANGULAR COLUMN ----------
 def read_rectangular_column_table(path: str, sheet: str = "Rectangular column") -> List[RectColumn]:
-    wb = load_workbook(path, data_only=True)
-    ws = wb[sheet]
+    return _read_sheet(path, sheet, _parse_rectangular_column_rows, _RECT_COLUMN_COLS)
+
 
+def _parse_rectangular_column_rows(rows: Iterable[Row]) -> List[RectColumn]:
     columns: List[RectColumn] = []
-    for row in ws.iter_rows(min_row=3, values_only=True):
+    for row in rows:
         if not row[0]:
             continue
         col = RectColumn(
@@ -106,11 +194,12 @@ def read_rectangular_column_table(path: str, sheet: str = "Rectangular column")
 
 # ----------CIRCULAR COLUMN ----------
 def read_circular_column_table(path: str, sheet: str = "Circular column") -> List[CircColumn]:
-    wb = load_workbook(path, data_only=True)
-    ws = wb[sheet]
+    return _read_sheet(path, sheet, _parse_circular_column_rows, _CIRC_COLUMN_COLS)
 
+
+def _parse_circular_column_rows(rows: Iterable[Row]) -> List[CircColumn]:
     columns: List[CircColumn] = []
-    for row in ws.iter_rows(min_row=3, values_only=True):
+    for row in rows:
         if not row[0]:
             continue
         col = CircColumn(
@@ -132,11 +221,12 @@ def read_circular_column_table(path: str, sheet: str = "Circular column") -> Lis
 
 # ---------- WALL ----------
 def read_wall_table(path: str, sheet: str = "Wall") -> List[Wall]:
-    wb = load_workbook(path, data_only=True)
-    ws = wb[sheet]
+    return _read_sheet(path, sheet, _parse_wall_rows, _WALL_COLS)
+
 
+def _parse_wall_rows(rows: Iterable[Row]) -> List[Wall]:
     walls: List[Wall] = []
-    for row in ws.iter_rows(min_row=3, values_only=True):
+    for row in rows:
         if not row[0]:
             continue
         level = row[0]
@@ -155,11 +245,12 @@ def read_wall_table(path: str, sheet: str = "Wall") -> List[Wall]:
 
 # ---------- COUPLING BEAM ----------
 def read_coupling_beam_table(path: str, sheet: str = "Coupling Beam") -> List[CouplingBeam]:
-    wb = load_workbook(path, data_only=True)
-    ws = wb[sheet]
+    return _read_sheet(path, sheet, _parse_coupling_beam_rows, _COUPLING_BEAM_COLS)
 
+
+def _parse_coupling_beam_rows(rows: Iterable[Row]) -> List[CouplingBeam]:
     beams: List[CouplingBeam] = []
-    for row in ws.iter_rows(min_row=3, values_only=True):
+    for row in rows:
         if not row[0]:
             continue
         level = row[0]
@@ -180,11 +271,12 @@ def read_coupling_beam_table(path: str, sheet: str = "Coupling Beam") -> List[Co
 
 # ---------- SLAB ----------
 def read_slab_table(path: str, sheet: str = "Slab") -> List[Slab]:
-    wb = load_workbook(path, data_only=True)
-    ws = wb[sheet]
+    return _read_sheet(path, sheet, _parse_slab_rows, _SLAB_COLS)
+
 
+def _parse_slab_rows(rows: Iterable[Row]) -> List[Slab]:
     slabs: List[Slab] = []
-    for row in ws.iter_rows(min_row=3, values_only=True):
+    for row in rows:
         if not row[0]:
             continue
         level = row[0]
@@ -197,3 +289,26 @@ def read_slab_table(path: str, sheet: str = "Slab") -> List[Slab]:
         slabs.append(Slab(level=level, name=name, material=material, slab_thk=thk, sdl=sdl, live=live))
 
     return slabs
+
+
+# ---------- ALL TABLES ----------
+def read_all_tables(path: str) -> InputTables:
+    """
+    Reads every input table from the workbook, opening the file only once.
+
+    :param path: Path to Excel file
+    :return: InputTables holding the parsed story, material and section tables
+    """
+    with _open_workbook(path) as sheet_rows:
+        tables = InputTables(
+            stories=_parse_story_rows(sheet_rows("Story", _STORY_COLS)),
+            concretes=_parse_concrete_rows(sheet_rows("Material", _CONCRETE_COLS)),
+            rect_columns=_parse_rectangular_column_rows(sheet_rows("Rectangular column", _RECT_COLUMN_COLS)),
+            circ_columns=_parse_circular_column_rows(sheet_rows("Circular column", _CIRC_COLUMN_COLS)),
+            walls=_parse_wall_rows(sheet_rows("Wall", _WALL_COLS)),
+            coupling_beams=_parse_coupling_beam_rows(sheet_rows("Coupling Beam", _COUPLING_BEAM_COLS)),
+            slabs=_parse_slab_rows(sheet_rows("Slab", _SLAB_COLS)),
+        )
+
+    _log_story_summary(tables.stories, "Story")
+    return tables
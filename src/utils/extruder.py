@@ -1,31 +1,39 @@
 from typing import List, Tuple, Dict
+
+import numpy as np
+
 from models.element_infor import Story, RectColumn, CircColumn, Wall, CouplingBeam, Slab
 from models.geometry3d import ColumnGeom, WallGeom, SlabGeom, Point3D, BeamGeom
+from utils.units import M_TO_MM
 
 
-def calculate_story_elevations(stories: List[Story], base_elevation: float = 0.0) -> List[float]:
+def calculate_story_elevations(stories: List[Story], base_elevation: float = 0.0) -> np.ndarray:
     """
     Calculate cumulative elevations for each story level.
 
     Args:
         stories: List of Story objects (ordered from bottom to top)
-        base_elevation: Base elevation in feet
+        base_elevation: Base elevation in meters
 
     Returns:
-        List of elevations for each story level
+        Array of len(stories) + 1 elevations (in meters), from the base to the top of the last story
     """
-    elevations = [base_elevation]
-    current_elev = base_elevation
+    # Running sum over [base, h1, h2, ...] adds in the same order as a Python loop
+    elevations = np.empty(len(stories) + 1, dtype=np.float64)
+    elevations[0] = base_elevation
+    elevations[1:] = [story.height for story in stories]
 
-    for story in stories:
-        current_elev += story.height
-        elevations.append(current_elev)
+    return np.cumsum(elevations, out=elevations)
 
-    return elevations
+
+def _story_z_mm(stories: List[Story], base_elevation: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the bottom and top elevation of every story, converted to mm."""
+    elevations = calculate_story_elevations(stories, base_elevation) * M_TO_MM
+    return elevations[:-1], elevations[1:]
 
 
 def extrude_points_to_columns(
-        dxf_points: List[Tuple[float, float, float]],
+        dxf_points: np.ndarray,
         stories: List[Story],
         rect_columns: List[RectColumn],
         circ_columns: List[CircColumn],
@@ -35,7 +43,7 @@ def extrude_points_to_columns(
     Extrude 2D points into 3D column geometry with proper section assignments.
 
     Args:
-        dxf_points: List of (x, y, z) points from DXF
+        dxf_points: (N, 3) array of (x, y, z) points from DXF
         stories: List of Story objects (bottom to top)
         rect_columns: Rectangular column properties by level
         circ_columns: Circular column properties by level
@@ -44,39 +52,44 @@ def extrude_points_to_columns(
     Returns:
         List of ColumnGeom objects
     """
-    elevations = calculate_story_elevations(stories, base_elevation)
+    z_bottoms, z_tops = _story_z_mm(stories, base_elevation)
 
     # Create lookup dictionaries for column properties by level
     rect_props = {col.level: col for col in rect_columns}
     circ_props = {col.level: col for col in circ_columns}
 
-    column_geometries = []
-
-    for point_idx, (x, y, _) in enumerate(dxf_points):
-        for story_idx, story in enumerate(stories):
-            z_bottom = elevations[story_idx] * 1000  # Convert to mm
-            z_top = elevations[story_idx + 1] * 1000  # Convert to mm
-
-            # Determine section name based on available column data
-            prop_name = "Default"
-            if story.level in rect_props:
-                prop_name = rect_props[story.level].name
-            elif story.level in circ_props:
-                prop_name = circ_props[story.level].name
-
-            column_geom = ColumnGeom(
-                start_point=(x, y, z_bottom),  # Convert to inches with z only
-                end_point=(x, y, z_top),
-                prop_name=prop_name,
-                # name=f"C{point_idx + 1}_{story.level}"
-            )
-            column_geometries.append(column_geom)
-
-    return column_geometries
+    # Determine section name per story based on available column data
+    prop_names = []
+    for story in stories:
+        prop_name = "Default"
+        if story.level in rect_props:
+            prop_name = rect_props[story.level].name
+        elif story.level in circ_props:
+            prop_name = circ_props[story.level].name
+        prop_names.append(prop_name)
+
+    # Broadcast every point against every story: (points, stories, xyz)
+    num_points, num_stories = len(dxf_points), len(stories)
+    start = np.empty((num_points, num_stories, 3))
+    start[..., :2] = dxf_points[:, None, :2]
+    start[..., 2] = z_bottoms
+    end = start.copy()
+    end[..., 2] = z_tops
+
+    return [
+        ColumnGeom(
+            start_point=tuple(start_point),
+            end_point=tuple(end_point),
+            prop_name=prop_name,
+        )
+        for start_point, end_point, prop_name in zip(
+            start.reshape(-1, 3).tolist(), end.reshape(-1, 3).tolist(), prop_names * num_points
+        )
+    ]
 
 
 def extrude_lines_to_walls(
-        dxf_lines: List[Tuple[Tuple[float, float, float], Tuple[float, float, float]]],
+        dxf_lines: np.ndarray,
         stories: List[Story],
         walls: List[Wall],
         base_elevation: float = 0.0
@@ -85,7 +98,7 @@ def extrude_lines_to_walls(
     Extrude 2D lines into 3D wall geometry with proper section assignments.
 
     Args:
-        dxf_lines: List of line segments from DXF
+        dxf_lines: (N, 2, 3) array of line segments from DXF
         stories: List of Story objects (bottom to top)
         walls: Wall properties by level
         base_elevation: Base elevation
@@ -93,39 +106,35 @@ def extrude_lines_to_walls(
     Returns:
         List of WallGeom objects
     """
-    elevations = calculate_story_elevations(stories, base_elevation)
+    z_bottoms, z_tops = _story_z_mm(stories, base_elevation)
 
     # Create lookup dictionary for wall properties by level
     wall_props = {wall.level: wall for wall in walls}
 
-    wall_geometries = []
-
-    for line_idx, ((x1, y1, _), (x2, y2, _)) in enumerate(dxf_lines):
-        for story_idx, story in enumerate(stories):
-            z_bottom = elevations[story_idx] * 1000  # Convert to mm
-            z_top = elevations[story_idx + 1] * 1000  # Convert to mm
-
-            # Get wall section name
-            prop_name = "Default"
-            if story.level in wall_props:
-                prop_name = wall_props[story.level].name
-
-            # Create 4-point wall geometry (rectangular wall panel)
-            x_coords = [x1, x2, x2, x1]  # Convert to inches
-            y_coords = [y1, y2, y2, y1]
-            z_coords = [z_bottom, z_bottom, z_top, z_top]
-
-            wall_geom = WallGeom(
-                num_points=4,
-                x_coord=x_coords,
-                y_coord=y_coords,
-                z_coord=z_coords,
-                prop_name=prop_name,
-                # name=f"W{line_idx + 1}_{story.level}"
-            )
-            wall_geometries.append(wall_geom)
-
-    return wall_geometries
+    # Get wall section name per story
+    prop_names = [wall_props[story.level].name if story.level in wall_props else "Default"
+                  for story in stories]
+
+    # 4-point wall panels (rectangular), broadcast to (lines, stories, corners)
+    num_lines, num_stories = len(dxf_lines), len(stories)
+    corners = [0, 1, 1, 0]  # start, end, end, start
+    shape = (num_lines, num_stories, 4)
+    x_coords = np.broadcast_to(dxf_lines[:, None, corners, 0], shape).reshape(-1, 4)
+    y_coords = np.broadcast_to(dxf_lines[:, None, corners, 1], shape).reshape(-1, 4)
+    z_coords = np.broadcast_to(
+        np.stack([z_bottoms, z_bottoms, z_tops, z_tops], axis=1), shape
+    ).reshape(-1, 4)
+
+    return [
+        WallGeom(
+            num_points=4,
+            x_coord=x_row,
+            y_coord=y_row,
+            z_coord=z_row,
+            prop_name=prop_name,
+        )
+        for x_row, y_row, z_row, prop_name in zip(x_coords, y_coords, z_coords, prop_names * num_lines)
+    ]
 
 
 def extrude_polylines_to_slabs(
@@ -146,34 +155,41 @@ def extrude_polylines_to_slabs(
     Returns:
         List of SlabGeom objects
     """
-    elevations = calculate_story_elevations(stories, base_elevation)
+    _, z_levels = _story_z_mm(stories, base_elevation)  # Slab at top of story, in mm
 
     # Create lookup dictionary for slab properties by level
     slab_props = {slab.level: slab for slab in slabs}
 
+    # Get slab section name and loads once per story
+    story_slabs = []
+    for story, z_level in zip(stories, z_levels.tolist()):
+        level_slab = slab_props.get(story.level)
+        if level_slab:
+            story_slabs.append((story.level, z_level, level_slab.name, level_slab.sdl, level_slab.live))
+        else:
+            story_slabs.append((story.level, z_level, "Default", 0.0, 0.0))
+
     slab_geometries = []
 
     for poly_idx, polyline in enumerate(dxf_polylines):
-        for story_idx, story in enumerate(stories):
-            z_level = elevations[story_idx + 1] * 1000  # Slab at top of story, convert to mm
-            # Get slab section name and loads
-            level_slab = slab_props.get(story.level)
-            prop_name = level_slab.name if level_slab else "Default"
-            sdl = level_slab.sdl if level_slab else 0.0
-            live = level_slab.live if level_slab else 0.0
-
-            # Extract coordinates and convert to inches
-            x_coords = [pt[0] for pt in polyline]
-            y_coords = [pt[1] for pt in polyline]
-            z_coords = [z_level] * len(polyline)
+        # Extract plan coordinates once; every story's slab shares the same read-only arrays
+        num_points = len(polyline)
+        coords = np.asarray(polyline, dtype=np.float64).reshape(-1, 3)
+        x_coords = np.ascontiguousarray(coords[:, 0])
+        y_coords = np.ascontiguousarray(coords[:, 1])
+        x_coords.flags.writeable = False
+        y_coords.flags.writeable = False
+
+        for level, z_level, prop_name, sdl, live in story_slabs:
+            z_coords = np.full(num_points, z_level)
 
             slab_geom = SlabGeom(
-                num_points=len(polyline),
+                num_points=num_points,
                 x_coord=x_coords,
                 y_coord=y_coords,
                 z_coord=z_coords,
                 prop_name=prop_name,
-                name=f"S{poly_idx + 1}_{story.level}",
+                name=f"S{poly_idx + 1}_{level}",
                 sdl=sdl,
                 live=live
             )
@@ -183,7 +199,7 @@ def extrude_polylines_to_slabs(
 
 
 def extrude_lines_to_beams(
-        dxf_lines: List[Tuple[Tuple[float, float, float], Tuple[float, float, float]]],
+        dxf_lines: np.ndarray,
         stories: List[Story],
         coupling_beams: List[CouplingBeam],
         base_elevation: float = 0.0
@@ -195,7 +211,7 @@ def extrude_lines_to_beams(
     rather than center points that need to be extended.
 
     Args:
-        dxf_lines: List of line segments from DXF
+        dxf_lines: (N, 2, 3) array of line segments from DXF
         stories: List of Story objects (bottom to top)
         coupling_beams: Coupling beam properties by level
         base_elevation: Base elevation in feet
@@ -203,36 +219,31 @@ def extrude_lines_to_beams(
     Returns:
         List of BeamGeom objects
     """
-    # Calculate story elevations
-    elevations = calculate_story_elevations(stories, base_elevation)
+    # Beams are placed at the floor level (top of each story)
+    _, z_levels = _story_z_mm(stories, base_elevation)
 
     # Create lookup dictionary for beam properties by level
     beam_props = {beam.level: beam for beam in coupling_beams}
 
-    beam_geometries = []
-
-    for line_idx, ((x1, y1, _), (x2, y2, _)) in enumerate(dxf_lines):
-        for story_idx, story in enumerate(stories):
-            # Beams are placed at the floor level (top of each story)
-            z_level = elevations[story_idx + 1] * 1000  # Convert to inches
-
-            # Create beam geometry using line endpoints
-            start_point = (x1, y1, z_level)
-            end_point = (x2, y2, z_level)
-
-            # Get beam section name for this level
-            prop_name = "Default"
-            if story.level in beam_props:
-                # For lines, we might need logic to determine X vs Y beam
-                # Based on line orientation or use a default
-                prop_name = beam_props[story.level].name
-
-            beam_geom = BeamGeom(
-                start_point=start_point,
-                end_point=end_point,
-                prop_name=prop_name,
-                # name=f"CB{line_idx + 1}_L_{story.level}"
-            )
-            beam_geometries.append(beam_geom)
-
-    return beam_geometries
+    # Get beam section name for each level
+    # For lines, we might need logic to determine X vs Y beam
+    # Based on line orientation or use a default
+    prop_names = [beam_props[story.level].name if story.level in beam_props else "Default"
+                  for story in stories]
+
+    # Broadcast line endpoints against every floor: (lines, stories, start/end, xyz)
+    num_lines, num_stories = len(dxf_lines), len(stories)
+    points = np.empty((num_lines, num_stories, 2, 3))
+    points[..., :2] = dxf_lines[:, None, :, :2]
+    points[..., 2] = z_levels[:, None]
+
+    return [
+        BeamGeom(
+            start_point=tuple(start_point),
+            end_point=tuple(end_point),
+            prop_name=prop_name,
+        )
+        for (start_point, end_point), prop_name in zip(
+            points.reshape(-1, 2, 3).tolist(), prop_names * num_lines
+        )
+    ]
@@ -5,32 +5,37 @@ This module processes each story individually using its own DXF file.
 Each level is extruded from its floor elevation to the floor above.
 """
 
-from typing import List, Dict
+import logging
+from typing import List, Dict, Optional
+
+import numpy as np
+from ezdxf.document import Drawing
+
 from models.element_infor import Story, RectColumn, CircColumn, Wall, CouplingBeam, Slab
 from models.geometry3d import ColumnGeom, WallGeom, SlabGeom, BeamGeom
-from utils.dxf_processing import read_dxf_plan, get_points_by_layer, get_lines_by_layer, get_polylines_by_layer
+from utils.dxf_processing import DxfCache, EntityIndex, read_dxf_plan, load_dxf_plan, get_points_by_layer, get_lines_by_layer, \
+    get_polylines_by_layer
+from utils.extruder import calculate_story_elevations
+from utils.units import M_TO_MM
 import os
 
+logger = logging.getLogger(__name__)
 
-def calculate_story_elevations(stories: List[Story], base_elevation: float = 0.0) -> Dict[str, float]:
+
+def group_by_level(items: List) -> Dict[str, List]:
     """
-    Calculate elevation for each story level.
+    Group property rows by their level, keeping the input order within each level.
 
     Args:
-        stories: List of Story objects (ordered from bottom to top)
-        base_elevation: Base elevation in meters
+        items: Property objects with a ``level`` attribute
 
     Returns:
-        Dictionary mapping level name to bottom elevation (in meters)
+        Dictionary mapping level name to the properties defined for that level
     """
-    elevations = {}
-    current_elev = base_elevation
-
-    for story in stories:
-        elevations[story.level] = current_elev
-        current_elev += story.height
-
-    return elevations
+    by_level = {}
+    for item in items:
+        by_level.setdefault(item.level, []).append(item)
+    return by_level
 
 
 def extrude_level_columns(
@@ -40,7 +45,9 @@ def extrude_level_columns(
         rect_columns: List[RectColumn],
         circ_columns: List[CircColumn],
         layer_rect: str = "REC COLS",
-        layer_circ: str = "CIR COLS"
+        layer_circ: str = "CIR COLS",
+        doc: Optional[Drawing] = None,
+        index: Optional[EntityIndex] = None
 ) -> List[ColumnGeom]:
     """
     Extrude columns for a single level from its DXF file.
@@ -53,57 +60,73 @@ def extrude_level_columns(
         circ_columns: List of circular column properties
         layer_rect: DXF layer name for rectangular columns
         layer_circ: DXF layer name for circular columns
+        doc: DXF document already read for this level; read from story.dxf_path if omitted
+        index: Entity index of doc shared between the extruders (optional)
 
     Returns:
         List of ColumnGeom objects
     """
-    if not story.dxf_path or not os.path.exists(story.dxf_path):
-        print(f"⚠️ Warning: DXF file not found for level {story.level}: {story.dxf_path}")
-        return []
-
-    doc = read_dxf_plan(story.dxf_path)
+    if doc is None:
+        if not story.dxf_path or not os.path.exists(story.dxf_path):
+            logger.warning("⚠️ DXF file not found for level %s: %s", story.level, story.dxf_path)
+            return []
+        doc = read_dxf_plan(story.dxf_path)
 
-    # Create lookup dictionaries
-    rect_props = {col.level: col for col in rect_columns if col.level == story.level}
-    circ_props = {col.level: col for col in circ_columns if col.level == story.level}
+    # Section of each column type for this level (the last row for the level wins)
+    rect_prop = next((col for col in reversed(rect_columns) if col.level == story.level), None)
+    circ_prop = next((col for col in reversed(circ_columns) if col.level == story.level), None)
 
     column_geometries = []
 
-    # Process rectangular columns
-    rect_points = get_points_by_layer(doc, layer_rect)
-    for x, y, _ in rect_points:
-        prop_name = rect_props.get(story.level, None)
-        if prop_name:
+    # Process rectangular columns; skip the layer entirely when the level has no section
+    if rect_prop:
+        rect_name = rect_prop.name
+        rect_xy = (get_points_by_layer(doc, layer_rect, index)[:, :2] * M_TO_MM).tolist()  # Convert m to mm
+        for x, y in rect_xy:
             column_geom = ColumnGeom(
-                start_point=(x * 1000, y * 1000, z_bottom),  # Convert m to mm
-                end_point=(x * 1000, y * 1000, z_top),  # Convert m to mm
-                prop_name=prop_name.name
+                start_point=(x, y, z_bottom),
+                end_point=(x, y, z_top),
+                prop_name=rect_name
             )
             column_geometries.append(column_geom)
 
     # Process circular columns
-    circ_points = get_points_by_layer(doc, layer_circ)
-    for x, y, _ in circ_points:
-        prop_name = circ_props.get(story.level, None)
-        if prop_name:
+    if circ_prop:
+        circ_name = circ_prop.name
+        circ_xy = (get_points_by_layer(doc, layer_circ, index)[:, :2] * M_TO_MM).tolist()  # Convert m to mm
+        for x, y in circ_xy:
             column_geom = ColumnGeom(
-                start_point=(x * 1000, y * 1000, z_bottom),  # Convert m to mm
-                end_point=(x * 1000, y * 1000, z_top),  # Convert m to mm
-                prop_name=prop_name.name
+                start_point=(x, y, z_bottom),
+                end_point=(x, y, z_top),
+                prop_name=circ_name
             )
             column_geometries.append(column_geom)
 
-    print(f"  ✓ Created {len(column_geometries)} columns for {story.level}")
+    logger.debug("  ✓ Created %d columns for %s", len(column_geometries), story.level)
     return column_geometries
 
 
+def _wall_panels(lines: np.ndarray, z_panel: np.ndarray, prop_name: str) -> List[WallGeom]:
+    """Build one 4-point wall panel per DXF line, with all corners computed in one array pass."""
+    # Corners run start, end, end, start; coordinates are converted m → mm
+    corners = lines[:, [0, 1, 1, 0], :2] * M_TO_MM
+    x_coords = np.ascontiguousarray(corners[..., 0])
+    y_coords = np.ascontiguousarray(corners[..., 1])
+    return [
+        WallGeom(num_points=4, x_coord=x_row, y_coord=y_row, z_coord=z_panel, prop_name=prop_name)
+        for x_row, y_row in zip(x_coords, y_coords)
+    ]
+
+
 def extrude_level_walls(
         story: Story,
         z_bottom: float,
         z_top: float,
         walls: List[Wall],
         layer_x: str = "WALL",
-        layer_y: str = "WALL Y"
+        layer_y: str = "WALL Y",
+        doc: Optional[Drawing] = None,
+        index: Optional[EntityIndex] = None
 ) -> List[WallGeom]:
     """
     Extrude walls for a single level from its DXF file.
@@ -115,55 +138,44 @@ def extrude_level_walls(
         walls: List of wall properties
         layer_x: DXF layer name for X-direction walls
         layer_y: DXF layer name for Y-direction walls
+        doc: DXF document already read for this level; read from story.dxf_path if omitted
+        index: Entity index of doc shared between the extruders (optional)
 
     Returns:
         List of WallGeom objects
     """
-    if not story.dxf_path or not os.path.exists(story.dxf_path):
-        print(f"⚠️ Warning: DXF file not found for level {story.level}: {story.dxf_path}")
-        return []
-
-    doc = read_dxf_plan(story.dxf_path)
+    if doc is None:
+        if not story.dxf_path or not os.path.exists(story.dxf_path):
+            logger.warning("⚠️ DXF file not found for level %s: %s", story.level, story.dxf_path)
+            return []
+        doc = read_dxf_plan(story.dxf_path)
 
     # Filter wall properties for this story only
     wall_props = [w for w in walls if w.level == story.level]
     if not wall_props:
-        print(f"⚠️ No wall properties found for level {story.level}")
+        logger.warning("⚠️ No wall properties found for level %s", story.level)
         return []
 
+    # First property with a valid wall name (assuming 1 per level), used for both directions
+    wall_name = next((w.name for w in wall_props if w.name), None)
+
     wall_geometries = []
 
-    # Process X-direction walls
-    wall_x_lines = get_lines_by_layer(doc, layer_x)
-    for (x1, y1, _), (x2, y2, _) in wall_x_lines:
-        for w in wall_props:
-            if w.name:  # check that we have a valid wall name
-                wall_geom = WallGeom(
-                    num_points=4,
-                    x_coord=[x1 * 1000, x2 * 1000, x2 * 1000, x1 * 1000],  # m → mm
-                    y_coord=[y1 * 1000, y2 * 1000, y2 * 1000, y1 * 1000],
-                    z_coord=[z_bottom, z_bottom, z_top, z_top],
-                    prop_name=w.name
-                )
-                wall_geometries.append(wall_geom)
-                break  # stop after first match (assuming 1 per level)
-
-    # Process Y-direction walls
-    wall_y_lines = get_lines_by_layer(doc, layer_y)
-    for (x1, y1, _), (x2, y2, _) in wall_y_lines:
-        for w in wall_props:
-            if w.name:
-                wall_geom = WallGeom(
-                    num_points=4,
-                    x_coord=[x1 * 1000, x2 * 1000, x2 * 1000, x1 * 1000],
-                    y_coord=[y1 * 1000, y2 * 1000, y2 * 1000, y1 * 1000],
-                    z_coord=[z_bottom, z_bottom, z_top, z_top],
-                    prop_name=w.name
-                )
-                wall_geometries.append(wall_geom)
-                break
-
-    print(f"  ✓ Created {len(wall_geometries)} walls for {story.level}")
+    # Every panel on this level shares one read-only z array
+    z_panel = np.array([z_bottom, z_bottom, z_top, z_top], dtype=np.float64)
+    z_panel.flags.writeable = False
+
+    # Only scan the wall layers when there is a section to assign to them
+    if wall_name:
+        # Process X-direction walls
+        wall_x_lines = get_lines_by_layer(doc, layer_x, index)
+        wall_geometries.extend(_wall_panels(wall_x_lines, z_panel, wall_name))
+
+        # Process Y-direction walls
+        wall_y_lines = get_lines_by_layer(doc, layer_y, index)
+        wall_geometries.extend(_wall_panels(wall_y_lines, z_panel, wall_name))
+
+    logger.debug("  ✓ Created %d walls for %s", len(wall_geometries), story.level)
     return wall_geometries
 
 
@@ -172,7 +184,9 @@ def extrude_level_beams(
         z_level: float,
         beams: List[CouplingBeam],
         layer_x: str = "CB X",
-        layer_y: str = "CB Y"
+        layer_y: str = "CB Y",
+        doc: Optional[Drawing] = None,
+        index: Optional[EntityIndex] = None
 ) -> List[BeamGeom]:
     """
     Extrude beams for a single level from its DXF file.
@@ -184,56 +198,51 @@ def extrude_level_beams(
         beams: List of beam properties
         layer_x: DXF layer name for X-direction beams
         layer_y: DXF layer name for Y-direction beams
+        doc: DXF document already read for this level; read from story.dxf_path if omitted
+        index: Entity index of doc shared between the extruders (optional)
 
     Returns:
         List of BeamGeom objects
     """
-    if not story.dxf_path or not os.path.exists(story.dxf_path):
-        print(f"⚠️ Warning: DXF file not found for level {story.level}: {story.dxf_path}")
-        return []
-
-    doc = read_dxf_plan(story.dxf_path)
+    if doc is None:
+        if not story.dxf_path or not os.path.exists(story.dxf_path):
+            logger.warning("⚠️ DXF file not found for level %s: %s", story.level, story.dxf_path)
+            return []
+        doc = read_dxf_plan(story.dxf_path)
 
     # Create lookup dictionary
     beam_props = {beam.level: beam for beam in beams if beam.level == story.level}
 
+    # Pick the beam section for each direction once; it does not depend on the line
+    beam_x = next((beam for beam in beam_props.values() if "X" in beam.name.upper()), None)
+    beam_y = next((beam for beam in beam_props.values() if "Y" in beam.name.upper()), None)
+
     beam_geometries = []
 
+    # Layers without a matching beam section are not scanned at all
     # Process X-direction beams
-    beam_x_lines = get_lines_by_layer(doc, layer_x)
-    for (x1, y1, _), (x2, y2, _) in beam_x_lines:
-        matching_beam = None
-        for beam in beam_props.values():
-            if "X" in beam.name.upper():
-                matching_beam = beam
-                break
-
-        if matching_beam:
+    if beam_x:
+        beam_x_lines = (get_lines_by_layer(doc, layer_x, index)[:, :, :2] * M_TO_MM).tolist()  # Convert m to mm
+        for (x1, y1), (x2, y2) in beam_x_lines:
             beam_geom = BeamGeom(
-                start_point=(x1 * 1000, y1 * 1000, z_level),  # Convert m to mm
-                end_point=(x2 * 1000, y2 * 1000, z_level),  # Convert m to mm
-                prop_name=matching_beam.name
+                start_point=(x1, y1, z_level),
+                end_point=(x2, y2, z_level),
+                prop_name=beam_x.name
             )
             beam_geometries.append(beam_geom)
 
     # Process Y-direction beams
-    beam_y_lines = get_lines_by_layer(doc, layer_y)
-    for (x1, y1, _), (x2, y2, _) in beam_y_lines:
-        matching_beam = None
-        for beam in beam_props.values():
-            if "Y" in beam.name.upper():
-                matching_beam = beam
-                break
-
-        if matching_beam:
+    if beam_y:
+        beam_y_lines = (get_lines_by_layer(doc, layer_y, index)[:, :, :2] * M_TO_MM).tolist()  # Convert m to mm
+        for (x1, y1), (x2, y2) in beam_y_lines:
             beam_geom = BeamGeom(
-                start_point=(x1 * 1000, y1 * 1000, z_level),  # Convert m to mm
-                end_point=(x2 * 1000, y2 * 1000, z_level),  # Convert m to mm
-                prop_name=matching_beam.name
+                start_point=(x1, y1, z_level),
+                end_point=(x2, y2, z_level),
+                prop_name=beam_y.name
             )
             beam_geometries.append(beam_geom)
 
-    print(f"  ✓ Created {len(beam_geometries)} beams for {story.level}")
+    logger.debug("  ✓ Created %d beams for %s", len(beam_geometries), story.level)
     return beam_geometries
 
 
@@ -241,7 +250,9 @@ def extrude_level_slabs(
         story: Story,
         z_level: float,
         slabs: List[Slab],
-        layer: str = "SLAB"
+        layer: str = "SLAB",
+        doc: Optional[Drawing] = None,
+        index: Optional[EntityIndex] = None
 ) -> List[SlabGeom]:
     """
     Extrude slabs for a single level from its DXF file.
@@ -252,15 +263,17 @@ def extrude_level_slabs(
         z_level: Floor elevation in mm
         slabs: List of slab properties
         layer: DXF layer name for slabs
+        doc: DXF document already read for this level; read from story.dxf_path if omitted
+        index: Entity index of doc shared between the extruders (optional)
 
     Returns:
         List of SlabGeom objects
     """
-    if not story.dxf_path or not os.path.exists(story.dxf_path):
-        print(f"⚠️ Warning: DXF file not found for level {story.level}: {story.dxf_path}")
-        return []
-
-    doc = read_dxf_plan(story.dxf_path)
+    if doc is None:
+        if not story.dxf_path or not os.path.exists(story.dxf_path):
+            logger.warning("⚠️ DXF file not found for level %s: %s", story.level, story.dxf_path)
+            return []
+        doc = read_dxf_plan(story.dxf_path)
 
     # Get slab properties for this level
     level_slab = None
@@ -270,17 +283,18 @@ def extrude_level_slabs(
             break
 
     if not level_slab:
-        print(f"⚠️ Warning: No slab properties found for level {story.level}")
+        logger.warning("⚠️ No slab properties found for level %s", story.level)
         return []
 
     slab_geometries = []
 
     # Process slab polylines
-    slab_polylines = get_polylines_by_layer(doc, layer)
+    slab_polylines = get_polylines_by_layer(doc, layer, index=index)
     for poly_idx, polyline in enumerate(slab_polylines):
-        x_coords = [pt[0] * 1000 for pt in polyline]  # Convert m to mm
-        y_coords = [pt[1] * 1000 for pt in polyline]  # Convert m to mm
-        z_coords = [z_level] * len(polyline)
+        coords = np.asarray(polyline, dtype=np.float64).reshape(-1, 3)
+        x_coords = coords[:, 0] * M_TO_MM  # Convert m to mm
+        y_coords = coords[:, 1] * M_TO_MM  # Convert m to mm
+        z_coords = np.full(len(x_coords), z_level)
 
         slab_geom = SlabGeom(
             num_points=len(polyline),
@@ -294,7 +308,7 @@ def extrude_level_slabs(
         )
         slab_geometries.append(slab_geom)
 
-    print(f"  ✓ Created {len(slab_geometries)} slabs for {story.level}")
+    logger.debug("  ✓ Created %d slabs for %s", len(slab_geometries), story.level)
     return slab_geometries
 
 
@@ -305,7 +319,8 @@ def process_all_levels(
         circ_columns: List[CircColumn],
         walls: List[Wall],
         beams: List[CouplingBeam],
-        slabs: List[Slab]
+        slabs: List[Slab],
+        dxf_cache: Optional[DxfCache] = None
 ) -> tuple:
     """
     Process all stories level-by-level, creating geometry from individual DXF files.
@@ -320,16 +335,34 @@ def process_all_levels(
         walls: All wall properties
         beams: All beam properties
         slabs: All slab properties
+        dxf_cache: Parsed DXF plans and entity indexes shared by stories that use the same
+            file; clearing it releases them. Defaults to a cache local to this call.
 
     Returns:
         Tuple of (all_columns, all_walls, all_beams, all_slabs)
     """
-    print("\n" + "=" * 60)
-    print("PROCESSING LEVELS FROM BOTTOM TO TOP")
-    print("=" * 60)
+    logger.info("PROCESSING LEVELS FROM BOTTOM TO TOP")
 
-    # Calculate elevations for all stories
+    if dxf_cache is None:
+        dxf_cache = {}
+
+    # Calculate elevations for all stories once; story idx spans [idx, idx + 1]
     elevations = calculate_story_elevations(stories, base_elevation)
+    elevations_m = elevations.tolist()
+    elevations_mm = (elevations * M_TO_MM).tolist()  # Convert m to mm
+
+    # Index properties by level once, so each story only scans its own rows
+    rect_by_level = group_by_level(rect_columns)
+    circ_by_level = group_by_level(circ_columns)
+    walls_by_level = group_by_level(walls)
+    beams_by_level = group_by_level(beams)
+    slabs_by_level = group_by_level(slabs)
+
+    # Validate DXF paths in one pass, checking each distinct file only once
+    dxf_found = {path: os.path.exists(path) for path in {story.dxf_path for story in stories if story.dxf_path}}
+    for story in stories:
+        if not dxf_found.get(story.dxf_path, False):
+            logger.warning("⚠️ DXF file not found for level %s: %s", story.level, story.dxf_path)
 
     all_columns = []
     all_walls = []
@@ -338,45 +371,47 @@ def process_all_levels(
 
     # Process each story from bottom to top
     for idx, story in enumerate(stories):
-        print(f"\n📐 Processing {story.level} (Story {idx + 1}/{len(stories)})")
-        print(f"   DXF: {story.dxf_path}")
-
-        z_bottom = elevations[story.level] * 1000  # Convert m to mm
-        z_top = (elevations[story.level] + story.height) * 1000  # Convert m to mm
+        elev_bottom, elev_top = elevations_m[idx], elevations_m[idx + 1]
+        z_bottom, z_top = elevations_mm[idx], elevations_mm[idx + 1]
         z_floor = z_top  # Slabs and beams at top of story
 
-        print(f"   Elevation: {elevations[story.level]:.2f}m to {elevations[story.level] + story.height:.2f}m")
+        if not dxf_found.get(story.dxf_path, False):
+            continue  # Already reported above
+
+        # Read this level's DXF and index it once, sharing both between the four extruders
+        doc, index = load_dxf_plan(story.dxf_path, dxf_cache)
 
         # Process columns (from bottom to top of this story)
         level_columns = extrude_level_columns(
-            story, z_bottom, z_top, rect_columns, circ_columns
+            story, z_bottom, z_top,
+            rect_by_level.get(story.level, []), circ_by_level.get(story.level, []), doc=doc, index=index
         )
         all_columns.extend(level_columns)
 
         # Process walls (from bottom to top of this story)
         level_walls = extrude_level_walls(
-            story, z_bottom, z_top, walls
+            story, z_bottom, z_top, walls_by_level.get(story.level, []), doc=doc, index=index
         )
         all_walls.extend(level_walls)
 
         # Process beams (at top of this story)
         level_beams = extrude_level_beams(
-            story, z_floor, beams
+            story, z_floor, beams_by_level.get(story.level, []), doc=doc, index=index
         )
         all_beams.extend(level_beams)
 
         # Process slabs (at top of this story)
         level_slabs = extrude_level_slabs(
-            story, z_floor, slabs
+            story, z_floor, slabs_by_level.get(story.level, []), doc=doc, index=index
         )
         all_slabs.extend(level_slabs)
 
-    print("\n" + "=" * 60)
-    print("PROCESSING COMPLETE")
-    print("=" * 60)
-    print(f"Total Columns: {len(all_columns)}")
-    print(f"Total Walls: {len(all_walls)}")
-    print(f"Total Beams: {len(all_beams)}")
-    print(f"Total Slabs: {len(all_slabs)}")
+        # One summary line per story instead of one message per extruder
+        logger.info("📐 %s (Story %d/%d, %.2fm to %.2fm): %d columns, %d walls, %d beams, %d slabs",
+                    story.level, idx + 1, len(stories), elev_bottom, elev_top,
+                    len(level_columns), len(level_walls), len(level_beams), len(level_slabs))
+
+    logger.info("PROCESSING COMPLETE: %d columns, %d walls, %d beams, %d slabs",
+                len(all_columns), len(all_walls), len(all_beams), len(all_slabs))
 
     return all_columns, all_walls, all_beams, all_slabs
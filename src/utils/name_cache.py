@@ -0,0 +1,47 @@
+class NameCache:
+    """
+    Caches ETABS property names for the lifetime of a model build.
+
+    A build only ever adds properties, so each name list is fetched from ETABS
+    once and then extended by the define_* functions as they create new
+    materials and sections. Call invalidate() if properties are changed outside of them.
+    """
+
+    def __init__(self, sap_model):
+        self._sap_model = sap_model
+        self._frame_names: set[str] | None = None
+        self._area_names: set[str] | None = None
+        self._material_names: set[str] | None = None
+
+    def frame_names(self) -> set[str]:
+        """Names of the frame properties defined in the model."""
+        if self._frame_names is None:
+            _, existing_names, ret = self._sap_model.PropFrame.GetNameList(0, [])
+            if ret != 0:
+                raise Exception(f"Failed to retrieve frame property names. Error code: {ret}")
+            self._frame_names = set(existing_names)
+        return self._frame_names
+
+    def area_names(self) -> set[str]:
+        """Names of the shell (area) properties defined in the model."""
+        if self._area_names is None:
+            _, existing_names, ret = self._sap_model.PropArea.GetNameList(0, [], 1)
+            if ret != 0:
+                raise Exception(f"Failed to retrieve shell property names. Error code: {ret}")
+            self._area_names = set(existing_names)
+        return self._area_names
+
+    def material_names(self) -> set[str]:
+        """Names of the materials defined in the model."""
+        if self._material_names is None:
+            _, existing_names, ret = self._sap_model.PropMaterial.GetNameList(0, [])
+            if ret != 0:
+                raise Exception(f"Failed to retrieve material names. Error code: {ret}")
+            self._material_names = set(existing_names)
+        return self._material_names
+
+    def invalidate(self):
+        """Drop the cached lists so the next lookup queries ETABS again."""
+        self._frame_names = None
+        self._area_names = None
+        self._material_names = None
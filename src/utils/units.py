@@ -0,0 +1,2 @@
+# Story heights and DXF plans are in meters; the model is driven in N-mm units
+M_TO_MM = 1000.0